@@ -66,10 +66,39 @@ const DESIGN_SYSTEM_VIOLATIONS = {
 // Files to exclude from checking
 const EXCLUDED_PATTERNS = ['node_modules/', 'app/globals.css', 'components/ui/', 'scripts/'];
 
+// Source files the check applies to (.ts, .tsx, .js, .jsx)
+const SOURCE_FILE_PATTERN = /\.(tsx?|jsx?)$/;
+
 function isExcludedFile(filePath) {
   return EXCLUDED_PATTERNS.some((pattern) => filePath.includes(pattern));
 }
 
+// Single predicate shared by the staged-files and full-scan paths
+function shouldCheckFile(filePath) {
+  return SOURCE_FILE_PATTERN.test(filePath) && !isExcludedFile(filePath);
+}
+
+// Directories never descended into during a full scan
+const SKIPPED_DIRS = new Set(['node_modules', '.next', '.git']);
+
+// Recursively collect checkable files in one pass over the tree
+// Skipped directories are pruned without reading their contents
+function walkFiles(dir, files = []) {
+  for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+    const entryPath = path.join(dir, entry.name);
+
+    if (entry.isDirectory()) {
+      if (!SKIPPED_DIRS.has(entry.name)) {
+        walkFiles(entryPath, files);
+      }
+    } else if (entry.isFile() && shouldCheckFile(entryPath)) {
+      files.push(entryPath);
+    }
+  }
+
+  return files;
+}
+
 // Get all TypeScript/JavaScript files to check
 function getFilesToCheck() {
   try {
@@ -87,9 +116,7 @@ function getFilesToCheck() {
 
       if (stagedFiles.length > 0 && stagedFiles[0] !== '') {
         inGitContext = true;
-        files = stagedFiles.filter(
-          (file) => file.match(/\.(tsx?|jsx?)$/) && !isExcludedFile(file) && fs.existsSync(file)
-        );
+        files = stagedFiles.filter((file) => shouldCheckFile(file) && fs.existsSync(file));
       }
     } catch {
       // Not in a git context
@@ -99,17 +126,7 @@ function getFilesToCheck() {
     // Only check all files if we're NOT in a git context
     // If we are in git context but files is empty, it means all staged files were excluded
     if (!inGitContext && files.length === 0) {
-      const allFiles = execSync(
-        'find . -type f \\( -name "*.ts" -o -name "*.tsx" -o -name "*.js" -o -name "*.jsx" \\) -not -path "*/node_modules/*" -not -path "*/.next/*" -not -path "*/.git/*"',
-        { encoding: 'utf8' }
-      )
-        .trim()
-        .split('\n')
-        .filter(Boolean);
-
-      files = allFiles
-        .filter((file) => !isExcludedFile(file))
-        .map((file) => file.replace(/^\.\//, ''));
+      files = walkFiles('.');
     }
 
     return files;
@@ -189,59 +206,48 @@ function checkFile(filePath) {
   return violations;
 }
 
-// Group violations by file for cleaner output
-function groupViolationsByFile(violations) {
-  const grouped = {};
-
-  for (const violation of violations) {
-    if (!grouped[violation.file]) {
-      grouped[violation.file] = [];
-    }
-    grouped[violation.file].push(violation);
-  }
-
-  return grouped;
-}
-
-// Format and print violations
-function printViolations(violations) {
-  const grouped = groupViolationsByFile(violations);
+// Format and print violations (grouped by file for cleaner output)
+function printViolations(grouped, violationCount) {
   const fileCount = Object.keys(grouped).length;
+  // Collect the report and write it to stderr once, instead of one write per line
+  const output = [];
 
   // Summary at top
-  console.error('\n\x1b[31m❌ Design system violations found!\x1b[0m');
-  console.error(`\x1b[33m${violations.length} violation(s) in ${fileCount} file(s)\x1b[0m\n`);
+  output.push('\n\x1b[31m❌ Design system violations found!\x1b[0m');
+  output.push(`\x1b[33m${violationCount} violation(s) in ${fileCount} file(s)\x1b[0m\n`);
 
   // Show violations grouped by file
   for (const [file, fileViolations] of Object.entries(grouped)) {
-    console.error(`\x1b[1m${file}\x1b[0m (${fileViolations.length} violation(s))`);
+    output.push(`\x1b[1m${file}\x1b[0m (${fileViolations.length} violation(s))`);
 
     for (const violation of fileViolations) {
       // Show line number and violation type
-      console.error(`\n  \x1b[2mLine ${violation.line}:\x1b[0m ${violation.message}`);
+      output.push(`\n  \x1b[2mLine ${violation.line}:\x1b[0m ${violation.message}`);
 
       // Show the actual code with violation highlighted
       const linePreview =
         violation.lineContent.length > 100
           ? `${violation.lineContent.substring(0, 100)}...`
           : violation.lineContent;
-      console.error(`  \x1b[31m  - ${linePreview}\x1b[0m`);
+      output.push(`  \x1b[31m  - ${linePreview}\x1b[0m`);
 
       // Show specific fix
-      console.error(
+      output.push(
         `  \x1b[32m  + ${violation.match}\x1b[0m → \x1b[32m${violation.suggestedFix}\x1b[0m`
       );
     }
-    console.error('');
+    output.push('');
   }
 
   // Quick reference at bottom
-  console.error('\x1b[1m━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\x1b[0m');
-  console.error('\x1b[1mQuick Reference - Available Design Tokens:\x1b[0m');
-  console.error('  \x1b[36mColors:\x1b[0m primary, secondary, destructive, muted, accent, success');
-  console.error('  \x1b[36mSpacing:\x1b[0m 0, 1, 2, 3, 4, 5, 6, 8, 10, 12, 16, 20, 24, etc.');
-  console.error('  \x1b[36mText:\x1b[0m text-xs, text-sm, text-base, text-lg');
-  console.error('  \x1b[36mRadius:\x1b[0m rounded-sm, rounded-md, rounded-lg, rounded-xl\n');
+  output.push('\x1b[1m━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\x1b[0m');
+  output.push('\x1b[1mQuick Reference - Available Design Tokens:\x1b[0m');
+  output.push('  \x1b[36mColors:\x1b[0m primary, secondary, destructive, muted, accent, success');
+  output.push('  \x1b[36mSpacing:\x1b[0m 0, 1, 2, 3, 4, 5, 6, 8, 10, 12, 16, 20, 24, etc.');
+  output.push('  \x1b[36mText:\x1b[0m text-xs, text-sm, text-base, text-lg');
+  output.push('  \x1b[36mRadius:\x1b[0m rounded-sm, rounded-md, rounded-lg, rounded-xl\n');
+
+  console.error(output.join('\n'));
 }
 
 // Main execution
@@ -255,15 +261,20 @@ function main() {
 
   console.log(`Checking ${files.length} file(s) for design system violations...`);
 
-  const allViolations = [];
+  // checkFile already returns one file's violations, so group as we go
+  const violationsByFile = {};
+  let violationCount = 0;
 
   for (const file of files) {
     const violations = checkFile(file);
-    allViolations.push(...violations);
+    if (violations.length > 0) {
+      violationsByFile[file] = violations;
+      violationCount += violations.length;
+    }
   }
 
-  if (allViolations.length > 0) {
-    printViolations(allViolations);
+  if (violationCount > 0) {
+    printViolations(violationsByFile, violationCount);
     process.exit(1);
   }
 
@@ -18,27 +18,38 @@
  * - Environment templates stay up to date
  *
  * Trade-offs:
- * - Adds ~500ms to pre-commit (grep for process.env)
+ * - Adds ~100ms to pre-commit (scans source files for process.env)
  * - Prevents undocumented env var sprawl
  * - Ensures templates are always current
  */
 
 const fs = require('node:fs');
 const path = require('node:path');
-const { execSync } = require('node:child_process');
 
 const ENV_DEVELOPMENT = '.env.development';
 const ENV_PRODUCTION = '.env.production';
 const ENV_LOCAL = '.env.development.local';
 
+// Matches: VARIABLE_NAME=value (captures the variable name)
+const ENV_ASSIGNMENT_PATTERN = /^([A-Z_][A-Z0-9_]*)=/;
+// Matches env var reads on process.env (captures the variable name)
+const ENV_USAGE_PATTERN = /process\.env\.([A-Z_][A-Z0-9_]*)/g;
+
 // Parse .env file into array of variable names
 // Skips comments and empty lines, extracts only variable names
+// Missing files (e.g. no .env.development.local) yield an empty list
 function parseEnvFile(filePath) {
-  if (!fs.existsSync(filePath)) {
-    return [];
+  let content;
+  try {
+    // Read directly instead of existsSync + readFileSync (one filesystem hit)
+    content = fs.readFileSync(filePath, 'utf8');
+  } catch (error) {
+    if (error.code === 'ENOENT') {
+      return [];
+    }
+    throw error;
   }
 
-  const content = fs.readFileSync(filePath, 'utf8');
   const vars = [];
 
   for (const line of content.split('\n')) {
@@ -47,8 +58,7 @@ function parseEnvFile(filePath) {
     if (!trimmed || trimmed.startsWith('#')) continue;
 
     // Extract variable name (before =)
-    // Matches: VARIABLE_NAME=value
-    const match = trimmed.match(/^([A-Z_][A-Z0-9_]*)=/);
+    const match = trimmed.match(ENV_ASSIGNMENT_PATTERN);
     if (match) {
       vars.push(match[1]);
     }
@@ -57,29 +67,88 @@ function parseEnvFile(filePath) {
   return vars;
 }
 
+const SOURCE_EXTENSIONS = ['.ts', '.tsx', '.js'];
+const EXCLUDED_DIRS = new Set(['node_modules', '.next', '.git', 'dist']);
+// Per-entry errors that skip the entry instead of failing the scan
+// (unreadable path, or removed between listing and reading - same as find 2>/dev/null)
+const SKIPPABLE_FS_ERRORS = new Set(['EACCES', 'ENOENT']);
+
+// Recursively collect source files in a single pass over the tree
+// Skips build artifacts and dependency directories without descending into them
+function walkSourceFiles(dir, files = []) {
+  let entries;
+  try {
+    entries = fs.readdirSync(dir, { withFileTypes: true });
+  } catch (error) {
+    if (SKIPPABLE_FS_ERRORS.has(error.code)) {
+      return files;
+    }
+    throw error;
+  }
+
+  for (const entry of entries) {
+    const entryPath = path.join(dir, entry.name);
+
+    if (entry.isDirectory()) {
+      if (!EXCLUDED_DIRS.has(entry.name)) {
+        walkSourceFiles(entryPath, files);
+      }
+    } else if (entry.isFile() && SOURCE_EXTENSIONS.includes(path.extname(entry.name))) {
+      files.push(entryPath);
+    }
+  }
+
+  return files;
+}
+
+// Max usage locations recorded per variable (shown for undocumented vars)
+const MAX_LOCATIONS = 3;
+
 // Find all process.env usages in actual code (not comments)
 // Excludes node_modules, .next, and other build artifacts
+// Returns a Map of variable name -> first few "file:line:content" locations
 function findEnvUsageInCode() {
   try {
-    // Search all .ts, .tsx, .js files for process.env references
-    // Use -v to exclude comment lines
-    const result = execSync(
-      `find . -type f \\( -name "*.ts" -o -name "*.tsx" -o -name "*.js" \\) ! -path "*/node_modules/*" ! -path "*/.next/*" ! -path "*/dist/*" -exec grep -Eho 'process\\.env\\.[A-Z_][A-Z0-9_]*' {} \\; 2>/dev/null || true`,
-      { encoding: 'utf8' }
-    );
+    // Read each .ts, .tsx, .js file once instead of spawning grep per file
+    // Locations are recorded in the same pass so undocumented vars need no rescan
+    const usages = new Map();
+    for (const file of walkSourceFiles('.')) {
+      let content;
+      try {
+        content = fs.readFileSync(file, 'utf8');
+      } catch (error) {
+        if (SKIPPABLE_FS_ERRORS.has(error.code)) continue;
+        throw error;
+      }
+      // Most files never touch process.env; skip the per-line regex pass for them
+      if (!content.includes('process.env.')) continue;
+
+      const lines = content.split('\n');
+
+      for (let lineNum = 0; lineNum < lines.length; lineNum++) {
+        const line = lines[lineNum];
+        const lineVars = new Set();
+        for (const match of line.matchAll(ENV_USAGE_PATTERN)) {
+          lineVars.add(match[1]);
+        }
 
-    const vars = new Set();
-    for (const line of result.split('\n')) {
-      const match = line.match(/process\.env\.([A-Z_][A-Z0-9_]*)/);
-      if (match) {
-        vars.add(match[1]);
+        for (const v of lineVars) {
+          if (!usages.has(v)) {
+            usages.set(v, []);
+          }
+          const locations = usages.get(v);
+          if (locations.length < MAX_LOCATIONS) {
+            locations.push(`./${file}:${lineNum + 1}:${line}`);
+          }
+        }
       }
     }
 
-    return Array.from(vars).sort();
+    return usages;
   } catch (error) {
-    console.error('Error searching code:', error.message);
-    return [];
+    // An incomplete scan would report every variable as documented, so fail the check
+    console.error('❌ Error searching code:', error.message);
+    process.exit(1);
   }
 }
 
@@ -91,17 +160,20 @@ function checkEnvSync() {
   const devVars = parseEnvFile(ENV_DEVELOPMENT);
   const prodVars = parseEnvFile(ENV_PRODUCTION);
   const localVars = parseEnvFile(ENV_LOCAL);
-  const codeVars = findEnvUsageInCode();
+  const codeUsages = findEnvUsageInCode();
+  const codeVars = Array.from(codeUsages.keys()).sort();
 
   // Combine dev and prod vars (all documented vars)
-  const documentedVars = [...new Set([...devVars, ...prodVars])];
+  // Sets keep the membership checks below O(1) per variable
+  const devVarSet = new Set(devVars);
+  const documentedVars = new Set([...devVars, ...prodVars]);
 
   console.log('\n🔍 Checking environment variable sync...\n');
 
   // CHECK 1: .env.development should contain all vars from .env.development.local
   // This ensures local overrides are documented
   if (localVars.length > 0) {
-    const missingInDev = localVars.filter((v) => !devVars.includes(v));
+    const missingInDev = localVars.filter((v) => !devVarSet.has(v));
 
     if (missingInDev.length > 0) {
       hasErrors = true;
@@ -128,30 +200,19 @@ function checkEnvSync() {
 
   // CHECK 2: Code should only use env vars documented in .env.development or .env.production
   // This prevents orphaned env var references
-  const undocumented = codeVars.filter((v) => !documentedVars.includes(v));
+  const undocumented = codeVars.filter((v) => !documentedVars.has(v));
 
   if (undocumented.length > 0) {
     hasErrors = true;
     console.error('\n❌ CHECK 2 FAILED: Code uses undocumented environment variables\n');
     console.error('Variables used in code but NOT in .env.development or .env.production:');
 
-    // Find where each var is used (show first 3 occurrences)
+    // Show where each var is used (first 3 occurrences, collected during the scan)
     for (const v of undocumented) {
       console.error(`\n  ${v}:`);
-      try {
-        const locations = execSync(
-          `grep -rn "process\\.env\\.${v}" --include="*.ts" --include="*.tsx" --include="*.js" --exclude-dir=node_modules --exclude-dir=.next . | head -3`,
-          { encoding: 'utf8' }
-        ).trim();
-
-        for (const loc of locations.split('\n')) {
-          if (loc) {
-            // Format: file:line:content
-            console.error(`    ${loc}`);
-          }
-        }
-      } catch (e) {
-        // grep returns non-zero if no matches (already handled)
+      for (const loc of codeUsages.get(v)) {
+        // Format: file:line:content
+        console.error(`    ${loc}`);
       }
     }
 